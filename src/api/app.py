@@ -1,7 +1,8 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 from prometheus_fastapi_instrumentator import Instrumentator
+from prometheus_client import REGISTRY
 import uvicorn
 import os
 import sys
@@ -13,13 +14,18 @@ import pandas as pd
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.utils.logger import get_logger
+from src.components.drift_monitor import DriftMonitor, load_reference_profile
 
 logger = get_logger("API")
 
 # --- SETTING ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 MODEL_PATH = os.path.join(BASE_DIR, 'models', 'titanic_pipeline.pkl')
+PROFILE_PATH = os.path.join(BASE_DIR, 'models', 'reference_profile.json')
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "500"))
+DRIFT_WINDOW_SIZE = int(os.getenv("DRIFT_WINDOW_SIZE", "1000"))
+DRIFT_MIN_SAMPLES = int(os.getenv("DRIFT_MIN_SAMPLES", "50"))
 
 # --- GLOBAL VARIABLES (RAM) ---
 ml_models = {}
@@ -37,6 +43,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"Critical Error: Model could not be loaded: {e}")
         ml_models["titanic"] = None
 
+    # Drift Monitor (scored lazily on each /metrics scrape)
+    try:
+        app.state.drift_monitor = DriftMonitor(
+            load_reference_profile(PROFILE_PATH),
+            window_size=DRIFT_WINDOW_SIZE,
+            min_samples=DRIFT_MIN_SAMPLES
+        )
+        REGISTRY.register(app.state.drift_monitor)
+        logger.info("Drift monitor started! 📈")
+    except Exception as e:
+        logger.warning(f"Drift monitor disabled: {e}")
+        app.state.drift_monitor = None
+
     # Redis Connection
     try:
         pool = redis.ConnectionPool(host=REDIS_HOST, port=6379, db=0, decode_responses=True)
@@ -51,6 +70,8 @@ async def lifespan(app: FastAPI):
 
     # 2. SHUTDOWN
     ml_models.clear()
+    if app.state.drift_monitor:
+        REGISTRY.unregister(app.state.drift_monitor)
     logger.info("Clean up complete. Shutting down...")
 
 
@@ -69,17 +90,17 @@ class PassengerData(BaseModel):
     Name: str
     Pclass: int
     Sex: str
-    Age: float
+    Age: float | None = None
     SibSp: int
     Parch: int
     Ticket: str
     Fare: float
     Cabin: str | None = None
-    Embarked: str
+    Embarked: str | None = None
 
 
 @app.post("/predict")
-def predict_survival(passenger: PassengerData, request: Request):
+def predict_survival(passenger: PassengerData, request: Request, background_tasks: BackgroundTasks):
     try:
         # 1. Create Cache Key
         data_dict = passenger.dict()
@@ -88,11 +109,15 @@ def predict_survival(passenger: PassengerData, request: Request):
 
         # 2. Redis Control (Accessed via State)
         r = request.app.state.redis
+        monitor = request.app.state.drift_monitor
         if r:
             cached = r.get(cache_key)
             if cached:
                 logger.info(f"Cache HIT! ⚡: {passenger.Name}")
-                return json.loads(cached)
+                cached_payload = json.loads(cached)
+                if monitor:
+                    background_tasks.add_task(monitor.update, data_dict, cached_payload["prediction"])
+                return cached_payload
 
         # 3. Model Prediction (from RAM)
         model = ml_models.get("titanic")
@@ -114,7 +139,11 @@ def predict_survival(passenger: PassengerData, request: Request):
             "source": "model"
         }
 
-        # 4. Write to Redis
+        # 4. Drift Monitoring (runs after the response is sent)
+        if monitor:
+            background_tasks.add_task(monitor.update, data_dict, result)
+
+        # 5. Write to Redis
         if r:
             cache_to_save = response_payload.copy()
             cache_to_save["source"] = "cache"
@@ -127,5 +156,45 @@ def predict_survival(passenger: PassengerData, request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/predict/batch")
+def predict_survival_batch(passengers: list[PassengerData], request: Request, background_tasks: BackgroundTasks):
+    if not passengers:
+        raise HTTPException(status_code=422, detail="Batch is empty")
+    if len(passengers) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch size exceeds limit of {MAX_BATCH_SIZE}")
+
+    model = ml_models.get("titanic")
+    if not model:
+        raise HTTPException(status_code=500, detail="Model not loaded")
+
+    try:
+        # One DataFrame, one predict() call for the whole batch
+        records = [p.dict() for p in passengers]
+        df = pd.DataFrame(records)
+        predictions = model.predict(df)
+
+        monitor = request.app.state.drift_monitor
+        if monitor:
+            background_tasks.add_task(monitor.update_many, records, [int(pred) for pred in predictions])
+
+        logger.info(f"Batch prediction computed for {len(passengers)} passengers 🧮")
+
+        return {
+            "predictions": [
+                {
+                    "passenger_id": p.PassengerId,
+                    "passenger_name": p.Name,
+                    "prediction": int(pred),
+                }
+                for p, pred in zip(passengers, predictions)
+            ],
+            "source": "model"
+        }
+
+    except Exception as e:
+        logger.error(f"Batch Prediction Error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
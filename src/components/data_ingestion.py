@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+from sklearn.model_selection import train_test_split
 
 # ---------------------
 def load_data(file_path: str) -> pd.DataFrame:
@@ -16,6 +17,25 @@ def load_data(file_path: str) -> pd.DataFrame:
     except Exception as e:
         raise Exception(f"ERROR: Something went wrong while reading the data: {e}")
 
+def load_train_test_split(config: dict, base_dir: str):
+    """
+    Loads the training CSV set in params.yaml and splits it into
+    X_train, X_test, y_train, y_test. Every pipeline that needs the training
+    rows (model, drift reference profile) must go through here.
+    """
+    data_path = os.path.join(base_dir, config['external_data_config']['external_data_csv'])
+    df = load_data(data_path)
+
+    X = df.drop('Survived', axis=1)
+    y = df['Survived']
+
+    return train_test_split(
+        X, y,
+        test_size=config['preprocessing_config']['train_test_split_ratio'],
+        random_state=config['preprocessing_config']['random_state'],
+        stratify=y
+    )
+
 if __name__ == "__main__":
     current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -0,0 +1,199 @@
+import json
+import math
+import os
+import threading
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+from prometheus_client.core import GaugeMetricFamily
+
+NUMERIC_FEATURES = ["Age", "Fare"]
+CATEGORICAL_FEATURES = ["Pclass", "Sex", "Embarked"]
+PREDICTION = "prediction"
+
+MISSING = "__missing__"
+EPSILON = 1e-4
+
+
+# ---------------------
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _category(value) -> str:
+    return MISSING if _is_missing(value) else str(value)
+
+
+def build_reference_profile(X: pd.DataFrame, y_pred, n_bins: int = 10) -> dict:
+    """
+    Summarises the training data into a small, JSON-ready reference profile.
+    X is the training split and y_pred the model's predictions on those same rows.
+    - Numeric features: quantile bin edges + share of rows per bin (last bin = missing).
+    - Categorical features and the predicted label: share of rows per category.
+    """
+    if len(X) != len(y_pred):
+        raise ValueError(f"ERROR: X has {len(X)} rows but y_pred has {len(y_pred)}. Use the same reference set.")
+
+    profile = {"n_samples": int(len(X)), "numeric": {}, "categorical": {}}
+
+    for col in NUMERIC_FEATURES:
+        values = X[col].to_numpy(dtype=float)
+        present = values[~np.isnan(values)]
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        edges = sorted(set(np.quantile(present, quantiles).round(6).tolist()))
+
+        counts = [0] * (len(edges) + 2)
+        for value in values:
+            idx = len(edges) + 1 if np.isnan(value) else bisect_right(edges, value)
+            counts[idx] += 1
+
+        profile["numeric"][col] = {
+            "edges": edges,
+            "proportions": [c / len(values) for c in counts],
+        }
+
+    columns = {col: X[col] for col in CATEGORICAL_FEATURES}
+    columns[PREDICTION] = pd.Series(y_pred)
+
+    for col, series in columns.items():
+        shares = series.map(_category).value_counts(normalize=True)
+        profile["categorical"][col] = {str(k): float(v) for k, v in shares.items()}
+
+    return profile
+
+
+def save_reference_profile(profile: dict, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_reference_profile(path: str) -> dict:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Reference profile could not be found: {path}. Run training_pipeline.py, or profile_pipeline.py for an already-trained model.")
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def psi(expected: list, actual: list) -> float:
+    """
+    Population Stability Index between two aligned lists of proportions.
+    """
+    score = 0.0
+    for e, a in zip(expected, actual):
+        e = max(e, EPSILON)
+        a = max(a, EPSILON)
+        score += (a - e) * math.log(a / e)
+    return score
+
+
+class DriftMonitor:
+    """
+    Streaming drift monitor for live /predict traffic.
+
+    Memory is constant: every feature keeps one fixed-size count array for the
+    current window and one for the previous window. update() is a bisect or a
+    dict lookup per feature, so it stays in the microseconds. PSI is only
+    computed when Prometheus scrapes /metrics (see collect()).
+    """
+    def __init__(self, profile: dict, window_size: int = 1000, min_samples: int = 50):
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+        self._edges = {col: ref["edges"] for col, ref in profile["numeric"].items()}
+        self._expected = {col: ref["proportions"] for col, ref in profile["numeric"].items()}
+
+        # Categorical features are binned as: known categories..., other
+        self._index = {}
+        for col, shares in profile["categorical"].items():
+            categories = sorted(shares)
+            self._index[col] = {cat: i for i, cat in enumerate(categories)}
+            self._expected[col] = [shares[cat] for cat in categories] + [0.0]
+
+        self._current = {col: [0] * len(exp) for col, exp in self._expected.items()}
+        self._previous = {col: [0] * len(exp) for col, exp in self._expected.items()}
+        self._current_n = 0
+        self._previous_n = 0
+
+    def _bin(self, col: str, value) -> int:
+        edges = self._edges.get(col)
+        if edges is not None:
+            return len(edges) + 1 if _is_missing(value) else bisect_right(edges, value)
+
+        index = self._index[col]
+        return index.get(_category(value), len(index))
+
+    def update(self, record: dict, prediction: int):
+        bins = [(col, self._bin(col, record.get(col))) for col in NUMERIC_FEATURES + CATEGORICAL_FEATURES]
+        bins.append((PREDICTION, self._bin(PREDICTION, prediction)))
+
+        with self._lock:
+            for col, idx in bins:
+                self._current[col][idx] += 1
+            self._current_n += 1
+
+            if self._current_n >= self.window_size:
+                self._previous, self._current = self._current, self._previous
+                for counts in self._current.values():
+                    counts[:] = [0] * len(counts)
+                self._previous_n, self._current_n = self._current_n, 0
+
+    def update_many(self, records: list, predictions: list):
+        for record, prediction in zip(records, predictions):
+            self.update(record, prediction)
+
+    def scores(self) -> tuple:
+        """
+        Returns (n_samples, {feature: psi}) over the current + previous window.
+        """
+        with self._lock:
+            n = self._current_n + self._previous_n
+            counts = {col: [c + p for c, p in zip(self._current[col], self._previous[col])]
+                      for col in self._current}
+
+        if n < self.min_samples:
+            return n, {}
+
+        return n, {col: psi(self._expected[col], [c / n for c in counts[col]])
+                   for col in counts}
+
+    def collect(self):
+        n, scores = self.scores()
+
+        samples = GaugeMetricFamily(
+            "titanic_drift_samples",
+            "Number of live requests in the drift monitor window."
+        )
+        samples.add_metric([], n)
+        yield samples
+
+        gauge = GaugeMetricFamily(
+            "titanic_drift_psi",
+            "Population Stability Index of live traffic vs. the training reference profile.",
+            labels=["feature"]
+        )
+        for col, score in scores.items():
+            gauge.add_metric([col], score)
+        yield gauge
+
+
+if __name__ == "__main__":
+    df_test = pd.DataFrame({
+        "Age": [22, np.nan, 38, 26, 35, 54],
+        "Fare": [7.25, 71.28, 7.92, 53.1, 8.05, 51.86],
+        "Pclass": [3, 1, 3, 1, 3, 1],
+        "Sex": ["male", "female", "female", "female", "male", "male"],
+        "Embarked": ["S", "C", "S", np.nan, "S", "S"],
+    })
+
+    reference = build_reference_profile(df_test, [0, 1, 1, 1, 0, 0], n_bins=3)
+    print(json.dumps(reference, indent=2))
+
+    monitor = DriftMonitor(reference, window_size=10, min_samples=1)
+    for _ in range(5):
+        monitor.update({"Age": 70.0, "Fare": 500.0, "Pclass": 1, "Sex": "female", "Embarked": "Q"}, 1)
+
+    print(monitor.scores())
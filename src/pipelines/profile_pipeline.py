@@ -0,0 +1,50 @@
+import os
+import pickle
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "../../"))
+sys.path.append(project_root)
+
+from src.utils.common import read_params
+from src.utils.logger import get_logger
+
+from src.components.data_ingestion import load_train_test_split
+from src.components.drift_monitor import build_reference_profile, save_reference_profile
+
+logger = get_logger(__name__)
+
+
+def create_reference_profile(config_path):
+    """
+    Rebuilds the drift reference profile for the model that is already on disk,
+    using the same training split as training_pipeline.py (no retraining).
+    Fails if the training data is missing.
+    """
+    config = read_params(config_path)
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    model_dir = os.path.join(base_dir, config['model_config']['model_dir'])
+    model_path = os.path.join(model_dir, config['model_config']['model_name'])
+    profile_path = os.path.join(model_dir, config['monitoring_config']['reference_profile_name'])
+    n_bins = config['monitoring_config']['n_bins']
+
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"{model_path} Not found. You should run training_pipeline.py first.")
+
+    X_train, _, _, _ = load_train_test_split(config, base_dir)
+
+    with open(model_path, 'rb') as f:
+        pipeline = pickle.load(f)
+
+    logger.info(f"The reference profile is being saved: {profile_path}")
+    profile = build_reference_profile(X_train, pipeline.predict(X_train), n_bins=n_bins)
+    save_reference_profile(profile, profile_path)
+
+    logger.info("Reference profile created successfully! ✅")
+
+
+if __name__ == "__main__":
+    config_path = os.path.join(project_root, "params.yaml")
+    create_reference_profile(config_path)
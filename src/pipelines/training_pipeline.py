@@ -12,11 +12,11 @@ from src.utils.common import read_params
 from src.utils.logger import get_logger
 
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
 from sklearn.pipeline import Pipeline
-from src.components.data_ingestion import load_data
+from src.components.data_ingestion import load_train_test_split
 from src.components.data_transformation import ColumnDropper, MissingValueImputer, CategoricalEncoder
+from src.components.drift_monitor import build_reference_profile, save_reference_profile
 
 logger = get_logger(__name__)
 
@@ -31,35 +31,20 @@ def train_model(config_path):
 
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    data_path = os.path.join(base_dir, config['external_data_config']['external_data_csv'])
     model_dir = os.path.join(base_dir, config['model_config']['model_dir'])
     model_name = config['model_config']['model_name']
     model_path = os.path.join(model_dir, model_name)
+    profile_path = os.path.join(model_dir, config['monitoring_config']['reference_profile_name'])
+    n_bins = config['monitoring_config']['n_bins']
 
-    random_state = config['preprocessing_config']['random_state']
     split_ratio = config['preprocessing_config']['train_test_split_ratio']
 
     n_estimators = config['model_config']['n_estimators']
     max_depth = config['model_config']['max_depth']
     model_random_state = config['model_config']['random_state']
 
-    logger.info(f"Loading data: {data_path}")
-
-    if not os.path.exists(data_path):
-        logger.error(f"ERROR: Data file not found -> {data_path}")
-        raise FileNotFoundError(f"{data_path} Not found. Please check the 'data/raw' folder.")
-
-    df = load_data(data_path)
-
-    X = df.drop('Survived', axis=1)
-    y = df['Survived']
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y,
-        test_size=split_ratio,
-        random_state=random_state,
-        stratify=y
-    )
+    logger.info(f"Loading data: {config['external_data_config']['external_data_csv']}")
+    X_train, X_test, y_train, y_test = load_train_test_split(config, base_dir)
 
     # --- MLFLOW RUN ---
     with mlflow.start_run():
@@ -102,6 +87,12 @@ def train_model(config_path):
         with open(model_path, 'wb') as f:
             pickle.dump(pipeline, f)
 
+        # --- REFERENCE PROFILE (For Drift Monitoring) ---
+        logger.info(f"The reference profile is being saved: {profile_path}")
+        profile = build_reference_profile(X_train, pipeline.predict(X_train), n_bins=n_bins)
+        save_reference_profile(profile, profile_path)
+        mlflow.log_artifact(profile_path)
+
         logger.info(f"Pipeline completed successfully! ✅")
 
 
@@ -0,0 +1,71 @@
+import pandas as pd
+import requests
+
+FEATURE_COLUMNS = [
+    "PassengerId", "Name", "Pclass", "Sex", "Age", "SibSp",
+    "Parch", "Ticket", "Fare", "Cabin", "Embarked",
+]
+OPTIONAL_COLUMNS = {"Age", "Cabin", "Embarked"}
+REQUIRED_COLUMNS = [col for col in FEATURE_COLUMNS if col not in OPTIONAL_COLUMNS]
+TEXT_COLUMNS = {"Name": str, "Ticket": str, "Cabin": str, "Sex": str, "Embarked": str}
+
+
+# ---------------------
+def read_passengers(file) -> pd.DataFrame:
+    """
+    Reads an uploaded CSV. Text columns stay str (e.g. all-numeric tickets like 349909).
+    """
+    try:
+        return pd.read_csv(file, dtype=TEXT_COLUMNS)
+    except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as e:
+        raise ValueError(f"ERROR: The file could not be read as CSV: {e}")
+
+
+def to_records(df: pd.DataFrame) -> list:
+    """
+    Turns the passengers into JSON-ready dicts (NaN -> None).
+    """
+    df = df[FEATURE_COLUMNS].astype(object)
+    return df.where(df.notna(), None).to_dict(orient="records")
+
+
+def prepare_records(df: pd.DataFrame) -> tuple:
+    """
+    Returns (records, skipped): the rows the API can score, and the rows that
+    miss a required value (e.g. Fare) and would fail their whole batch.
+    """
+    missing = sorted(set(REQUIRED_COLUMNS) - set(df.columns))
+    if missing:
+        raise ValueError(f"ERROR: Missing columns: {', '.join(missing)}")
+
+    df = df.copy()
+    for col in OPTIONAL_COLUMNS - set(df.columns):
+        df[col] = None
+
+    incomplete = df[REQUIRED_COLUMNS].isna().any(axis=1)
+    return to_records(df[~incomplete]), df[incomplete]
+
+
+def score_in_chunks(records: list, predict_fn, chunk_size: int):
+    """
+    Yields (start, end, predictions, error) per chunk. A failed chunk yields its
+    error and the remaining chunks are still scored.
+    """
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        end = start + len(chunk)
+        try:
+            predictions, error = predict_fn(chunk), None
+        except Exception as e:
+            predictions, error = [], e
+        yield start, end, predictions, error
+
+
+def describe_error(error: Exception) -> str:
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"ERROR: {error.response.text}"
+    return f"Connection Error: {str(error)}"
+
+
+def label(prediction: int) -> str:
+    return "Survived" if prediction == 1 else "Didn't Survive"
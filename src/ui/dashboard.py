@@ -1,7 +1,50 @@
 import streamlit as st
 import requests
-import json
+import pandas as pd
 import os
+import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.ui.batch import (
+    FEATURE_COLUMNS, read_passengers, prepare_records, score_in_chunks, describe_error, label
+)
+
+# --- SETTING ---
+API_URL = os.getenv("API_URL", "http://api:8000").rstrip("/")
+PREDICT_URL = f"{API_URL}/predict"
+BATCH_URL = f"{API_URL}/predict/batch"
+REQUEST_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "100"))
+
+
+# --- HTTP SESSION (shared across reruns) ---
+@st.cache_resource
+def get_session() -> requests.Session:
+    session = requests.Session()
+    # Only connection failures are retried; a request that reached the API is never resent.
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# --- API CALLS (memoized on their inputs) ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def predict_one(data: dict) -> dict:
+    response = get_session().post(PREDICT_URL, json=data, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def predict_chunk(records: list) -> list:
+    response = get_session().post(BATCH_URL, json=records, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()["predictions"]
+
 
 # Page Settings
 st.set_page_config(page_title="Titanic Survival Prediction", layout="centered")
@@ -10,59 +53,114 @@ st.title("Titanic Survival Prediction")
 st.write("---")
 st.markdown("Model: Random Forest | API: FastAPI | Orchestration: Kubernetes")
 
+single_tab, batch_tab = st.tabs(["Single Passenger", "Bulk Upload (CSV)"])
+
 # Form Part
-with st.form("prediction_form"):
-    st.header("Passenger Infos")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        passenger_id = st.number_input("Passenger ID", value=123)
-        name = st.text_input("Name Surname", value="Joe Harrington")
-        pclass = st.selectbox("Class", [1, 2, 3], index=2)
-        sex = st.selectbox("Sex", ["male", "female"])
-        age = st.number_input("Age", min_value=0.0, max_value=100.0, value=25.0)
-
-    with col2:
-        sibsp = st.number_input("SibSp", min_value=0, value=0)
-        parch = st.number_input("Parch", min_value=0, value=0)
-        fare = st.number_input("Ticket Price", min_value=0.0, value=50.0)
-        embarked = st.selectbox("Port of Embarkation", ["S", "C", "Q"])
-        cabin = st.text_input("Cabin No", value="C123")
-        ticket = st.text_input("Ticket No", value="A/5 21171")
-
-    submit_val = st.form_submit_button("Predict")
-
-if submit_val:
-    data = {
-        "PassengerId": passenger_id,
-        "Name": name,
-        "Pclass": pclass,
-        "Sex": sex,
-        "Age": age,
-        "SibSp": sibsp,
-        "Parch": parch,
-        "Ticket": ticket,
-        "Fare": fare,
-        "Cabin": cabin,
-        "Embarked": embarked,
-    }
-
-    URL = "http://api:8000/predict"
-
-    try:
-        response = requests.post(URL, json=data)
-        if response.status_code == 200:
-            result = response.json()
+with single_tab:
+    with st.form("prediction_form"):
+        st.header("Passenger Infos")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            passenger_id = st.number_input("Passenger ID", value=123)
+            name = st.text_input("Name Surname", value="Joe Harrington")
+            pclass = st.selectbox("Class", [1, 2, 3], index=2)
+            sex = st.selectbox("Sex", ["male", "female"])
+            age = st.number_input("Age", min_value=0.0, max_value=100.0, value=25.0)
+
+        with col2:
+            sibsp = st.number_input("SibSp", min_value=0, value=0)
+            parch = st.number_input("Parch", min_value=0, value=0)
+            fare = st.number_input("Ticket Price", min_value=0.0, value=50.0)
+            embarked = st.selectbox("Port of Embarkation", ["S", "C", "Q"])
+            cabin = st.text_input("Cabin No", value="C123")
+            ticket = st.text_input("Ticket No", value="A/5 21171")
+
+        submit_val = st.form_submit_button("Predict")
+
+    if submit_val:
+        data = {
+            "PassengerId": passenger_id,
+            "Name": name,
+            "Pclass": pclass,
+            "Sex": sex,
+            "Age": age,
+            "SibSp": sibsp,
+            "Parch": parch,
+            "Ticket": ticket,
+            "Fare": fare,
+            "Cabin": cabin,
+            "Embarked": embarked,
+        }
+
+        try:
+            result = predict_one(data)
             prediction = result["prediction"]
 
-            if prediction == "Survived":
+            if prediction == 1:
                 st.success(f"{name} survived! 🎉")
                 st.balloons()
             else:
                 st.error(f"{name} couldn't survive.")
-        else:
-            st.error(f"ERROR: {response.text}")
 
-    except Exception as e:
-        st.error(f"Connection Error: {str(e)}")
\ No newline at end of file
+        except Exception as e:
+            st.error(describe_error(e))
+
+# Bulk Upload Part
+with batch_tab:
+    st.header("Upload Passengers")
+    st.caption(f"CSV columns: {', '.join(FEATURE_COLUMNS)}. Sent to the API in chunks of {BATCH_CHUNK_SIZE}.")
+
+    uploaded_file = st.file_uploader("Passenger CSV", type="csv")
+
+    if uploaded_file is not None:
+        try:
+            records, skipped = prepare_records(read_passengers(uploaded_file))
+        except ValueError as e:
+            st.error(str(e))
+            records, skipped = [], None
+
+        if skipped is not None:
+            st.write(f"{len(records)} passengers loaded.")
+            if not skipped.empty:
+                st.warning(f"{len(skipped)} rows skipped, missing required values:")
+                st.dataframe(skipped)
+
+        if records and st.button("Predict All"):
+            total = len(records)
+            progress = st.progress(0.0, text="Scoring passengers...")
+            table = st.empty()
+            rows = []
+            failed = 0
+
+            # A failed chunk is reported and skipped; the others are still scored
+            for start, end, predictions, error in score_in_chunks(records, predict_chunk, BATCH_CHUNK_SIZE):
+                if error:
+                    failed += end - start
+                    st.error(f"Rows {start + 1}-{end}: {describe_error(error)}")
+
+                for item in predictions:
+                    rows.append({
+                        "PassengerId": item["passenger_id"],
+                        "Name": item["passenger_name"],
+                        "Prediction": label(item["prediction"]),
+                    })
+
+                progress.progress(end / total, text=f"Processed {end}/{total} passengers")
+                if rows:
+                    table.dataframe(pd.DataFrame(rows))
+
+            if failed:
+                st.warning(f"{failed} of {total} passengers could not be scored.")
+
+            if rows:
+                results = pd.DataFrame(rows)
+                st.success(f"Survival rate: {(results['Prediction'] == 'Survived').mean():.1%}")
+                st.download_button(
+                    "Download Results",
+                    results.to_csv(index=False).encode("utf-8"),
+                    file_name="titanic_predictions.csv",
+                    mime="text/csv",
+                    on_click="ignore",
+                )
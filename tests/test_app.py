@@ -1,14 +1,23 @@
 from fastapi.testclient import TestClient
+import pytest
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import src.api.app as api
 from src.api.app import app
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def live_client():
+    # Runs the lifespan, so the model (and Redis / drift monitor state) is loaded
+    with TestClient(app) as c:
+        yield c
+
+
 def test_read_root():
     response = client.get("/")
     assert response.status_code == 200
@@ -37,4 +46,45 @@ def test_predict_survival():
     json_data = response.json()
     assert "prediction" in json_data
     assert "success" in json_data
-    assert json_data["success"] is True
\ No newline at end of file
+    assert json_data["success"] is True
+
+BATCH_PASSENGER = {
+    "PassengerId": 1,
+    "Name": "Batch Passenger",
+    "Pclass": 1,
+    "Sex": "female",
+    "Age": None,
+    "SibSp": 1,
+    "Parch": 0,
+    "Ticket": "PC 17599",
+    "Fare": 71.28,
+    "Cabin": None,
+    "Embarked": "C"
+}
+
+
+def test_predict_survival_batch(live_client):
+    payload = [BATCH_PASSENGER, {**BATCH_PASSENGER, "PassengerId": 2, "Sex": "male", "Pclass": 3}]
+
+    response = live_client.post("/predict/batch", json=payload)
+
+    assert response.status_code == 200
+
+    predictions = response.json()["predictions"]
+    assert len(predictions) == 2
+    assert [p["passenger_id"] for p in predictions] == [1, 2]
+    assert all(p["prediction"] in (0, 1) for p in predictions)
+
+
+def test_predict_survival_batch_empty(live_client):
+    response = live_client.post("/predict/batch", json=[])
+
+    assert response.status_code == 422
+
+
+def test_predict_survival_batch_too_large(live_client, monkeypatch):
+    monkeypatch.setattr(api, "MAX_BATCH_SIZE", 2)
+
+    response = live_client.post("/predict/batch", json=[BATCH_PASSENGER] * 3)
+
+    assert response.status_code == 413
@@ -0,0 +1,53 @@
+import io
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ui.batch import read_passengers, prepare_records, score_in_chunks
+
+CSV = """PassengerId,Pclass,Name,Sex,Age,SibSp,Parch,Ticket,Fare,Cabin,Embarked
+892,3,"Kelly, Mr. James",male,34.5,0,0,330911,7.8292,,Q
+893,3,"Wilkes, Mrs. James",female,,1,0,363272,7.0,,S
+1044,3,"Storey, Mr. Thomas",male,60.5,0,0,3701,,,S
+"""
+
+
+def test_prepare_records():
+    records, skipped = prepare_records(read_passengers(io.StringIO(CSV)))
+
+    # Missing Fare is skipped; missing Age / Cabin become None
+    assert skipped["PassengerId"].tolist() == [1044]
+    assert [r["PassengerId"] for r in records] == [892, 893]
+    assert records[0]["Ticket"] == "330911"
+    assert records[1]["Age"] is None
+    assert records[0]["Cabin"] is None
+
+
+def test_prepare_records_columns():
+    without_optional = "PassengerId,Pclass,Name,Sex,SibSp,Parch,Ticket,Fare\n1,3,A,male,0,0,1,7.25\n"
+    records, _ = prepare_records(read_passengers(io.StringIO(without_optional)))
+    assert records[0]["Embarked"] is None
+
+    with pytest.raises(ValueError, match="Missing columns: Fare"):
+        prepare_records(read_passengers(io.StringIO("PassengerId,Pclass,Name,Sex,SibSp,Parch,Ticket\n")))
+
+
+def test_read_passengers_empty_file():
+    with pytest.raises(ValueError):
+        read_passengers(io.StringIO(""))
+
+
+def test_score_in_chunks_continues_after_failure():
+    def predict(chunk):
+        if chunk[0] == 2:
+            raise RuntimeError("boom")
+        return [x * 10 for x in chunk]
+
+    results = list(score_in_chunks([0, 1, 2, 3, 4], predict, chunk_size=2))
+
+    assert [(start, end) for start, end, _, _ in results] == [(0, 2), (2, 4), (4, 5)]
+    assert results[0][2] == [0, 10] and results[2][2] == [40]
+    assert results[1][2] == [] and isinstance(results[1][3], RuntimeError)
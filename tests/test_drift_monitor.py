@@ -0,0 +1,98 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.api.app as api
+from src.components.drift_monitor import DriftMonitor, build_reference_profile, save_reference_profile
+
+reference_df = pd.DataFrame({
+    "Age": [22, np.nan, 38, 26, 35, 54, 2, 27],
+    "Fare": [7.25, 71.28, 7.92, 53.1, 8.05, 51.86, 21.07, 11.13],
+    "Pclass": [3, 1, 3, 1, 3, 1, 3, 3],
+    "Sex": ["male", "female", "female", "female", "male", "male", "male", "female"],
+    "Embarked": ["S", "C", "S", np.nan, "S", "S", "S", "S"],
+})
+reference_pred = [0, 1, 1, 1, 0, 0, 0, 1]
+profile = build_reference_profile(reference_df, reference_pred, n_bins=4)
+
+
+def test_reference_profile():
+    for col in ["Age", "Fare"]:
+        ref = profile["numeric"][col]
+        assert len(ref["proportions"]) == len(ref["edges"]) + 2
+        assert abs(sum(ref["proportions"]) - 1) < 1e-9
+
+    assert profile["numeric"]["Age"]["proportions"][-1] == 1 / 8
+    assert profile["categorical"]["Embarked"]["__missing__"] == 1 / 8
+    assert set(profile["categorical"]["prediction"]) == {"0", "1"}
+
+
+def test_drift_monitor_psi():
+    monitor = DriftMonitor(profile, window_size=100, min_samples=5)
+
+    for _, row in reference_df.iterrows():
+        monitor.update(row.to_dict(), 0)
+    n, stable = monitor.scores()
+
+    for _ in range(8):
+        monitor.update({"Age": 80.0, "Fare": 512.33, "Pclass": 1, "Sex": "female", "Embarked": "Q"}, 1)
+    n_drifted, drifted = monitor.scores()
+
+    assert n == 8 and n_drifted == 16
+    assert stable["Age"] < 0.01
+    assert drifted["Age"] > stable["Age"]
+    assert drifted["Embarked"] > 0.1
+
+
+def test_drift_monitor_window_is_bounded():
+    monitor = DriftMonitor(profile, window_size=10, min_samples=1)
+
+    for _ in range(35):
+        monitor.update({"Age": 30.0, "Fare": 10.0, "Pclass": 3, "Sex": "male", "Embarked": "S"}, 0)
+
+    n, _ = monitor.scores()
+    assert n == 15
+
+
+LIVE_PASSENGERS = [
+    {"PassengerId": i, "Name": f"Passenger {i}", "Pclass": 3, "Sex": "male", "Age": 30.0,
+     "SibSp": 0, "Parch": 0, "Ticket": "A/5 21171", "Fare": 7.25, "Cabin": None, "Embarked": "S"}
+    for i in range(60)
+]
+
+
+def test_drift_metrics_exposed(tmp_path, monkeypatch):
+    profile_path = tmp_path / "reference_profile.json"
+    save_reference_profile(profile, str(profile_path))
+    monkeypatch.setattr(api, "PROFILE_PATH", str(profile_path))
+
+    # Opened twice so the lifespan has to unregister and re-register the collector
+    for _ in range(2):
+        with TestClient(api.app) as client:
+            assert client.app.state.drift_monitor is not None
+
+            response = client.post("/predict/batch", json=LIVE_PASSENGERS)
+            assert response.status_code == 200
+
+            metrics = client.get("/metrics").text
+            assert 'titanic_drift_psi{feature="Age"}' in metrics
+            assert "titanic_drift_samples 60.0" in metrics
+
+
+def test_drift_metrics_wait_for_min_samples(tmp_path, monkeypatch):
+    profile_path = tmp_path / "reference_profile.json"
+    save_reference_profile(profile, str(profile_path))
+    monkeypatch.setattr(api, "PROFILE_PATH", str(profile_path))
+    monkeypatch.setattr(api, "DRIFT_MIN_SAMPLES", 100)
+
+    with TestClient(api.app) as client:
+        client.post("/predict/batch", json=LIVE_PASSENGERS)
+        metrics = client.get("/metrics").text
+
+    assert "titanic_drift_samples 60.0" in metrics
+    assert 'titanic_drift_psi{feature="Age"}' not in metrics